@@ -0,0 +1,105 @@
+# Language translations for dashboard text, keyed by language code
+TRANSLATIONS = {
+    "en": {
+        "title": "Airbnb Listings Analysis Dashboard",
+        "language": "Language",
+        "select_ward": "Select Ward",
+        "select_ward_placeholder": "Select a ward",
+        "apply": "Apply",
+        "summary": "Summary",
+        "longitude": "Longitude",
+        "latitude": "Latitude",
+        "total_hosts": "Total Hosts",
+        "total_listings": "Total Listings",
+        "lowest_rating": "Lowest Rating",
+        "highest_rating": "Highest Rating",
+        "overall_sentiment": "Overall Sentiment",
+        "cape_town_summary": "Cape Town Summary",
+        "about_dashboard": "About this Dashboard",
+        "about_text": "This is a dashboard that displays Airbnb listings in Cape Town, South Africa. The data is sourced from Inside Airbnb and is updated monthly.",
+        "main_title": "Airbnb Listings Analysis Dashboard",
+        "main_subtitle": "Prepared for Cape Town, South Africa",
+        "sentiments_heading": "Overall Sentiments by User Reviews",
+        "positive_reviews": "Positive Reviews (%)",
+        "negative_reviews": "Negative Reviews (%)",
+        "neutral_reviews": "Neutral Reviews (%)",
+        "sentiment_score": "Overall Sentiment Score (-1 to +1)",
+        "price_metrics": "Price Metrics",
+        "price_metrics_desc": "Key Airbnb metrics for selected ward vs Cape Town overall:\n- **Lowest/Highest Price** in ward\n- **Avg Price** (with Cape Town difference)\n- **Avg Rating** (with Cape Town difference)",
+        "lowest_price": "Lowest Price",
+        "highest_price": "Highest Price",
+        "average_price": "Average Price",
+        "average_rating": "Average Rating",
+        "occupancy_revenue": "Occupancy & Revenue Metrics",
+        "occupancy_revenue_desc": "Key Airbnb occupancy and revenue metrics for selected ward vs Cape Town overall:\n- **Avg. Occupancy Rate** (with Cape Town difference)\n- **Avg. Monthly Revenue** (with Cape Town difference)",
+        "avg_occupancy": "Average Occupancy Rate",
+        "avg_monthly_revenue": "Average Monthly Revenue",
+        "host_metrics": "Host Metrics",
+        "host_metrics_desc": "Key Airbnb host metrics for selected ward vs Cape Town overall:\n- **Avg. Host Response Rate** (with Cape Town difference)\n- **Avg. Host Acceptance Rate** (with Cape Town difference)\n- **Verified Hosts (%)** (with Cape Town difference)\n- **Superhosts (%)** (with Cape Town difference)",
+        "avg_response_rate": "Avg. Host Response Rate",
+        "avg_acceptance_rate": "Avg. Host Acceptance Rate",
+        "verified_hosts": "Verified Hosts (%)",
+        "superhosts": "Superhosts (%)",
+        "listings_breakdown": "Listings & Room Type Breakdown",
+        "listings_breakdown_heading": "Listings by Room Type and Property Type",
+        "listings_breakdown_desc": "Sunburst chart showing Airbnb listings by room type and property type.\n- **Size**: Number of listings per category\n- **Color**: Average estimated revenue per listing (Viridis scale)",
+        "wordcloud": "Neighbourhood Overview Word Cloud",
+        "wordcloud_desc": "Word cloud generated from Airbnb neighbourhood overviews.\n- **Larger Words**: More frequently mentioned terms in overviews\n- **Stopwords Removed**: Common words filtered out for clarity",
+        "listings_map_title": "Listings Map and Data Table",
+        "listings_data_table": "Listings Data Table",
+        "listings_data_desc": "Data table of Airbnb listings in the selected ward.\n- **Price**: Price per night in ZAR\n- **Rating**: Average review score rating",
+        "listings_map": "Listings Map",
+        "listings_map_desc": "Map showing Airbnb listings in the selected ward.\n- **Markers**: Each marker represents a listing\n- **Popup Info**: Click on a marker to see price and rating details",
+    },
+    "de": {
+        "title": "Airbnb-Angebote Analyse Dashboard",
+        "language": "Sprache",
+        "select_ward": "Wählen Sie Ward",
+        "select_ward_placeholder": "Wählen Sie einen Ward",
+        "apply": "Anwenden",
+        "summary": "Zusammenfassung",
+        "longitude": "Längengrad",
+        "latitude": "Breitengrad",
+        "total_hosts": "Gesamtzahl der Gastgeber",
+        "total_listings": "Gesamtzahl der Angebote",
+        "lowest_rating": "Niedrigste Bewertung",
+        "highest_rating": "Höchste Bewertung",
+        "overall_sentiment": "Gesamtstimmung",
+        "cape_town_summary": "Kapstadt Zusammenfassung",
+        "about_dashboard": "Über dieses Dashboard",
+        "about_text": "Dies ist ein Dashboard, das Airbnb-Angebote in Kapstadt, Südafrika anzeigt. Die Daten stammen von Inside Airbnb und werden monatlich aktualisiert.",
+        "main_title": "Airbnb-Angebote Analyse Dashboard",
+        "main_subtitle": "Vorbereitet für Kapstadt, Südafrika",
+        "sentiments_heading": "Gesamtstimmung nach Benutzerbewertungen",
+        "positive_reviews": "Positive Bewertungen (%)",
+        "negative_reviews": "Negative Bewertungen (%)",
+        "neutral_reviews": "Neutrale Bewertungen (%)",
+        "sentiment_score": "Gesamtstimmungs-Score (-1 bis +1)",
+        "price_metrics": "Preismetriken",
+        "price_metrics_desc": "Wichtige Airbnb-Metriken für ausgewählten Ward vs. Kapstadt insgesamt:\n- **Niedrigster/Höchster Preis** im Ward\n- **Durchschnittspreis** (mit Kapstadt-Differenz)\n- **Durchschnittliche Bewertung** (mit Kapstadt-Differenz)",
+        "lowest_price": "Niedrigster Preis",
+        "highest_price": "Höchster Preis",
+        "average_price": "Durchschnittspreis",
+        "average_rating": "Durchschnittliche Bewertung",
+        "occupancy_revenue": "Auslastungs- und Umsatzmetriken",
+        "occupancy_revenue_desc": "Wichtige Airbnb-Auslastungs- und Umsatzmetriken für ausgewählten Ward vs. Kapstadt insgesamt:\n- **Durchschn. Auslastungsrate** (mit Kapstadt-Differenz)\n- **Durchschn. Monatlicher Umsatz** (mit Kapstadt-Differenz)",
+        "avg_occupancy": "Durchschnittliche Auslastungsrate",
+        "avg_monthly_revenue": "Durchschnittlicher Monatlicher Umsatz",
+        "host_metrics": "Gastgeber-Metriken",
+        "host_metrics_desc": "Wichtige Airbnb-Gastgeber-Metriken für ausgewählten Ward vs. Kapstadt insgesamt:\n- **Durchschn. Gastgeber-Reaktionsrate** (mit Kapstadt-Differenz)\n- **Durchschn. Gastgeber-Annahmerate** (mit Kapstadt-Differenz)\n- **Verifizierte Gastgeber (%)** (mit Kapstadt-Differenz)\n- **Superhosts (%)** (mit Kapstadt-Differenz)",
+        "avg_response_rate": "Durchschn. Gastgeber-Reaktionsrate",
+        "avg_acceptance_rate": "Durchschn. Gastgeber-Annahmerate",
+        "verified_hosts": "Verifizierte Gastgeber (%)",
+        "superhosts": "Superhosts (%)",
+        "listings_breakdown": "Angebote und Zimmertyp-Aufschlüsselung",
+        "listings_breakdown_heading": "Angebote nach Zimmertyp und Immobilientyp",
+        "listings_breakdown_desc": "Sunburst-Diagramm mit Airbnb-Angeboten nach Zimmertyp und Immobilientyp.\n- **Größe**: Anzahl der Angebote pro Kategorie\n- **Farbe**: Durchschnittlicher geschätzter Umsatz pro Angebot (Viridis-Skala)",
+        "wordcloud": "Nachbarschafts-Übersichts-Wort-Wolke",
+        "wordcloud_desc": "Wort-Wolke aus Airbnb-Nachbarschaftsübersichten.\n- **Größere Wörter**: Häufiger erwähnte Begriffe in Übersichten\n- **Stoppwörter entfernt**: Häufige Wörter zur Klarheit herausgefiltert",
+        "listings_map_title": "Angebotskarte und Datentabelle",
+        "listings_data_table": "Angebots-Datentabelle",
+        "listings_data_desc": "Datentabelle der Airbnb-Angebote im ausgewählten Ward.\n- **Preis**: Preis pro Nacht in ZAR\n- **Bewertung**: Durchschnittliche Bewertung",
+        "listings_map": "Angebotskarte",
+        "listings_map_desc": "Karte mit Airbnb-Angeboten im ausgewählten Ward.\n- **Markierungen**: Jede Markierung stellt ein Angebot dar\n- **Popup-Info**: Klicken Sie auf eine Markierung, um Preis- und Bewertungsdetails zu sehen",
+    }
+}
@@ -1,21 +1,40 @@
+import pandas as pd
 from .universal import LoadNormalisedData
 
 class HostsDataLoader(LoadNormalisedData):
     def __init__(self):
         super().__init__()  
+        self._hosts_cleaned = None
+        self._host_index = None
     
     def transform_hosts(self):
-        """Clean and deduplicate hosts data."""
-        drop_cols = [
-            'host_name', 'host_location', 
-            'host_has_profile_pic', 'host_about', 'host_verifications'   
-        ]
-        
-        # Only drop columns that actually exist
-        existing_drop_cols = [col for col in drop_cols if col in self.hosts.columns]
-        hosts_cleaned = self.hosts.drop(columns=existing_drop_cols)
-        
-        # Deduplicate and reset index
-        hosts_cleaned = hosts_cleaned.drop_duplicates(subset=['host_id']).reset_index(drop=True)
+        """Clean and deduplicate hosts data, once."""
+        if self._hosts_cleaned is None:
+            drop_cols = [
+                'host_name', 'host_location', 
+                'host_has_profile_pic', 'host_about', 'host_verifications'   
+            ]
+            
+            # Only drop columns that actually exist
+            existing_drop_cols = [col for col in drop_cols if col in self.hosts.columns]
+            hosts_cleaned = self.hosts.drop(columns=existing_drop_cols)
+            
+            # Deduplicate and reset index
+            hosts_cleaned = hosts_cleaned.drop_duplicates(subset=['host_id']).reset_index(drop=True)
 
-        return hosts_cleaned
\ No newline at end of file
+            # Plain float32 rates (missing as NaN) and NumPy bool flags reduce without nullable masks
+            hosts_cleaned = hosts_cleaned.astype({
+                'host_response_rate': 'float32',
+                'host_acceptance_rate': 'float32',
+                'host_is_superhost': 'bool',
+                'host_identity_verified': 'bool'
+            })
+            self._hosts_cleaned = hosts_cleaned
+
+        return self._hosts_cleaned
+
+    def index_hosts_by_id(self):
+        """Hash index over the cleaned hosts' host_id column, built once."""
+        if self._host_index is None:
+            self._host_index = pd.Index(self.transform_hosts()['host_id'])
+        return self._host_index
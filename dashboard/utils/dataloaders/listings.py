@@ -4,16 +4,29 @@ from .universal import LoadNormalisedData
 class ListingsDataLoader(LoadNormalisedData):
     def __init__(self):
         super().__init__()
+        self._ward_indices = None
+        self._listings_x_ratings = None
         
     def transform_listings_with_ratings(self):
-        """Merge listings with review scores and filter valid records."""
-        listings_x_ratings = pd.merge(
-            self.listings,
-            self.listing_reviews, 
-            on='listing_id',
-            how='left'
-        )
-        
-        # Filter out listings without price or rating data
-        listings_x_ratings = listings_x_ratings.dropna(subset=['price_usd', 'review_scores_rating'])
-        return listings_x_ratings
\ No newline at end of file
+        """Merge listings with review scores and filter valid records, once."""
+        if self._listings_x_ratings is None:
+            # Filter out listings without price or rating data before joining, and
+            # only bring the rating column across
+            priced_listings = self.listings.dropna(subset=['price_usd'])
+            ratings = self.listing_reviews[['listing_id', 'review_scores_rating']].dropna(subset=['review_scores_rating'])
+            self._listings_x_ratings = pd.merge(
+                priced_listings,
+                ratings,
+                on='listing_id',
+                how='inner',
+                sort=False,
+                copy=False
+            )
+        return self._listings_x_ratings
+
+    def index_listings_by_ward(self):
+        """Map each neighbourhood_id to its row positions in the rated listings, once."""
+        if self._ward_indices is None:
+            listings_x_ratings = self.transform_listings_with_ratings()
+            self._ward_indices = listings_x_ratings.groupby('neighbourhood_id', sort=False).indices
+        return self._ward_indices
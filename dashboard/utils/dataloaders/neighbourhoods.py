@@ -1,6 +1,7 @@
 import re
 import json
-import pandas as pd
+import numpy as np
+from joblib import Parallel, delayed
 from .universal import LoadNormalisedData, analyzer
 
 
@@ -8,17 +9,33 @@ class NeighbourhoodsDataLoader(LoadNormalisedData):
 
     def __init__(self):
         super().__init__()
+        self._neighbourhoods = None
+        self._name_indices = None
+        self._neighbourhood_overviews = None
+        self._overview_indices = None
 
     def transform_neighbourhoods(self):
-        """Transform neighbourhood data by merging with ward information."""
-        # Create a copy of wards to avoid modifying global variable
-        wards_df = self.wards.copy()
-        wards_df['neighbourhood_id'] = wards_df['Name'].str.replace('Ward', '').str.strip().astype(int)
+        """Transform neighbourhood data by merging with ward information, once."""
+        if self._neighbourhoods is None:
+            self._neighbourhoods = self._build_neighbourhoods()
+        return self._neighbourhoods
+
+    def index_neighbourhoods_by_name(self):
+        """Map each ward name to its row positions in the neighbourhoods, once."""
+        if self._name_indices is None:
+            neighbourhoods = self.transform_neighbourhoods()
+            self._name_indices = neighbourhoods.groupby('name', sort=False).indices
+        return self._name_indices
+
+    def _build_neighbourhoods(self):
+        # Key wards by their id without modifying the shared wards frame
+        wards_df = self.wards.assign(
+            neighbourhood_id=self.wards['Name'].str.replace('Ward', '').str.strip().astype('int32')
+        )
         
-        new_wards = pd.merge(
-            self.neighbourhoods,
-            wards_df,
-            on='neighbourhood_id',
+        # Join on the ward id as an index rather than merging on a column
+        new_wards = self.neighbourhoods.set_index('neighbourhood_id').join(
+            wards_df.set_index('neighbourhood_id'),
             how='left'
         )
 
@@ -28,27 +45,43 @@ class NeighbourhoodsDataLoader(LoadNormalisedData):
         
         # Standardize column names
         new_wards.columns = [col.lower() for col in new_wards.columns]
-        new_wards = new_wards.drop_duplicates()
+        # Deduplicate on the ward id and sort by it in a single grouped pass
+        new_wards = new_wards.groupby(level='neighbourhood_id', sort=True).first().reset_index()
         new_wards = self._fill_nan_coordinates(new_wards)
-        new_wards = new_wards.sort_values('neighbourhood_id').reset_index(drop=True)
         
         # Fill missing names with "Ward {id}"
         mask = new_wards['name'].isna()
-        new_wards.loc[mask, 'name'] = new_wards.loc[mask, 'neighbourhood_id'].apply(lambda x: f"Ward {x}")
+        new_wards.loc[mask, 'name'] = 'Ward ' + new_wards.loc[mask, 'neighbourhood_id'].astype(str)
 
         return new_wards
 
     def transform_neighbourhood_overviews(self):
-        """Transform neighbourhood overviews in preparation for visualisations and metrics."""
+        """Transform neighbourhood overviews in preparation for visualisations and metrics, once."""
+        if self._neighbourhood_overviews is None:
+            self._neighbourhood_overviews = self._build_neighbourhood_overviews()
+        return self._neighbourhood_overviews
 
+    def index_overviews_by_ward(self):
+        """Map each neighbourhood_id to its row positions in the neighbourhood overviews, once."""
+        if self._overview_indices is None:
+            neighbourhood_overviews = self.transform_neighbourhood_overviews()
+            self._overview_indices = neighbourhood_overviews.groupby('neighbourhood_id', sort=False).indices
+        return self._overview_indices
+
+    def _build_neighbourhood_overviews(self):
         df = self.neighbourhood_overviews.copy()
         df = df.dropna(subset=['neighbourhood_id', 'neighbourhood_overview'])
         df['neighbourhood_overview'] = df['neighbourhood_overview'].str.strip().str.lower()
         df['cleaned_overview'] = df['neighbourhood_overview'].apply(self._preprocess_text)
-        df['sentiment_scores'] = df['cleaned_overview'].apply(lambda x: analyzer.polarity_scores(x))
-        df['compound_sentiment'] = df['sentiment_scores'].apply(lambda x: x['compound'])
-        df['sentiment_label'] = df['compound_sentiment'].apply(
-            lambda x: 'positive' if x >= 0.05 else ('negative' if x <= -0.05 else 'neutral')
+        # VADER scoring is pure Python and CPU bound, so spread it across cores
+        sentiment_scores = Parallel(n_jobs=-1, batch_size=256)(
+            delayed(analyzer.polarity_scores)(text) for text in df['cleaned_overview']
+        )
+        # Keep only the compound score rather than a column of per-row dicts
+        compound = np.fromiter((scores['compound'] for scores in sentiment_scores), dtype=float, count=len(sentiment_scores))
+        df['compound_sentiment'] = compound
+        df['sentiment_label'] = np.select(
+            [compound >= 0.05, compound <= -0.05], ['positive', 'negative'], default='neutral'
         )
 
         return df
@@ -3,6 +3,7 @@ import re
 import sys
 import json
 import nltk
+from functools import lru_cache
 import pandas as pd
 import streamlit as st
 from pathlib import Path
@@ -16,41 +17,76 @@ stop_words = set(stopwords.words('english'))
 lemmatizer = WordNetLemmatizer()
 analyzer = SentimentIntensityAnalyzer()
 
+# Text cleaning patterns, compiled once rather than per review
+NON_ALPHA_RE = re.compile(r'[^a-zA-Z\s]')
+URL_RE = re.compile(r'http\S+|www\S+|https\S+', flags=re.MULTILINE)
+MENTION_RE = re.compile(r'@\w+|#\w+')
+
+# Overviews repeat a small vocabulary, so lemmatise each distinct word only once
+lemmatize = lru_cache(maxsize=None)(lemmatizer.lemmatize)
+
 project_root = Path(__file__).resolve().parents[3]
 sys.path.insert(0, str(project_root))
 
 from src.normalisers import NormaliseReviews, NormaliseListings
 
+# Raw listings columns the normalisers and dashboard use; the remaining ~40 columns are never read
+LISTINGS_COLUMNS = [
+    'id', 'neighborhood_overview', 'neighbourhood', 'neighbourhood_cleansed',
+    'latitude', 'longitude', 'property_type', 'room_type', 'price',
+    'estimated_occupancy_l365d', 'estimated_revenue_l365d', 'review_scores_rating',
+    'host_id', 'host_response_rate', 'host_acceptance_rate', 'host_is_superhost', 'host_identity_verified',
+    # Night columns are needed because listings missing any of them are dropped
+    'minimum_nights', 'maximum_nights', 'minimum_minimum_nights', 'maximum_minimum_nights',
+    'minimum_maximum_nights', 'maximum_maximum_nights', 'minimum_nights_avg_ntm', 'maximum_nights_avg_ntm',
+]
+
+
+def read_source(data_dir, name, csv_name, columns=None):
+    """Read a source table from Parquet if it has been built, else from the raw CSV"""
+    parquet_path = data_dir / 'parquet' / f'{name}.parquet'
+    if parquet_path.exists():
+        return pd.read_parquet(parquet_path, engine='pyarrow', columns=columns)
+    return pd.read_csv(data_dir / 'raw' / csv_name, usecols=columns)
+
+
 # Load data files
 @st.cache_data
 def load_base_data():
-    """Load and return all base data files"""
+    """Load and return the base data files every dashboard view needs"""
     data_dir = project_root / 'data'
-    reviews = pd.read_csv(data_dir / 'raw'/ 'reviews.csv.gz')
-    listings = pd.read_csv(data_dir / 'raw'/ 'listings.csv.gz')
-    calendar = pd.read_csv(data_dir / 'raw'/ 'calendar.csv.gz')
-    wards = pd.read_csv(data_dir / 'raw'/ 'wards.csv')
+    listings = read_source(data_dir, 'listings', 'listings.csv.gz', columns=LISTINGS_COLUMNS)
+    wards = read_source(data_dir, 'wards', 'wards.csv')
     with open(data_dir / 'contractions.json') as f:
         contractions = json.load(f)
-    return reviews, listings, calendar, wards, contractions
+    return listings, wards, contractions
 
-reviews, listings, calendar, wards, contractions = load_base_data()
 
+@st.cache_resource(show_spinner=False)
+def get_review_comments():
+    """Load and normalise the review comments on first use; no dashboard view reads them yet"""
+    reviews = read_source(project_root / 'data', 'reviews', 'reviews.csv.gz')
+    return NormaliseReviews(reviews).normalise_reviews()
 
-def normalize_data(reviews, listings):
-    """Normalize reviews and listings data"""
-    normalise_reviews = NormaliseReviews(reviews)
-    review_comments = normalise_reviews.normalise_reviews()
-    
+
+def normalize_data(listings):
+    """Normalize listings data"""
     normalise_listings = NormaliseListings(listings)
     unique_hosts = normalise_listings.normalise_hosts()
     unique_listings = normalise_listings.normalise_listings()
     neighbourhoods = normalise_listings.normalise_neighbourhoods()
     listing_reviews = normalise_listings.normalise_listing_reviews()
     neighbourhood_overviews = normalise_listings.normalise_neighbourhood_overview()
+
+    # Downcast the numeric columns the dashboard filters and aggregates to halve their size
+    float_cols = ['price_usd', 'estimated_occupancy_l365d', 'estimated_revenue_l365d']
+    unique_listings[float_cols] = unique_listings[float_cols].astype('float32')
+    listing_reviews = listing_reviews.astype({'review_scores_rating': 'float32'})
+    # Ward numbers fit comfortably in int32; coordinates stay float64 so ward centres keep 5dp precision
+    for df in (unique_listings, neighbourhoods, neighbourhood_overviews):
+        df['neighbourhood_id'] = df['neighbourhood_id'].astype('int32')
     
     return {
-        'review_comments': review_comments,
         'unique_hosts': unique_hosts,
         'unique_listings': unique_listings,
         'neighbourhoods': neighbourhoods,
@@ -59,28 +95,55 @@ def normalize_data(reviews, listings):
     }
 
 
-normalized_data = normalize_data(reviews, listings)
+@st.cache_resource(show_spinner=False)
+def get_normalised():
+    """Load and normalise the base data once per server process, shared by every loader"""
+    listings, wards, contractions = load_base_data()
+    normalised_data = normalize_data(listings)
+    normalised_data['wards'] = wards
+    normalised_data['contractions'] = contractions
+    return normalised_data
 
 
 class LoadNormalisedData:
     def __init__(self):
-        self.wards = wards
-        self.reviews = normalized_data['review_comments']
-        self.hosts = normalized_data['unique_hosts']
-        self.listings = normalized_data['unique_listings']
-        self.neighbourhoods = normalized_data['neighbourhoods']
-        self.listing_reviews = normalized_data['listing_reviews']
-        self.neighbourhood_overviews = normalized_data['neighbourhood_overviews']
-        self.contractions = contractions     
+        normalised_data = get_normalised()
+        self.wards = normalised_data['wards']
+        self.hosts = normalised_data['unique_hosts']
+        self.listings = normalised_data['unique_listings']
+        self.neighbourhoods = normalised_data['neighbourhoods']
+        self.listing_reviews = normalised_data['listing_reviews']
+        self.neighbourhood_overviews = normalised_data['neighbourhood_overviews']
+        self.contractions = normalised_data['contractions']
+        self._contraction_re, self._expansions = self._compile_contractions(self.contractions)
+
+    @property
+    def reviews(self):
+        """Normalised review comments, loaded the first time they are accessed."""
+        return get_review_comments()
+
+    def _compile_contractions(self, contractions):
+        """Compile all contractions into one longest-first regex and its replacement lookup."""
+        # Expand each contraction the way replacing them one after another would, so
+        # overlapping keys such as "can't" / "can't've" keep their previous expansion
+        expansions = {}
+        for key in contractions:
+            expanded = key
+            for contraction, expansion in contractions.items():
+                expanded = expanded.replace(contraction, expansion)
+            expansions[key] = expanded
+        pattern = '|'.join(re.escape(key) for key in sorted(contractions, key=len, reverse=True))
+        return re.compile(pattern), expansions
 
     def _preprocess_text(self, text):
-        for contraction, expansion in self.contractions.items():
-            text = text.replace(contraction, expansion)
-        text = re.sub(r'[^a-zA-Z\s]', '', str(text).lower())
-        text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
-        text = re.sub(r'@\w+|#\w+', '', text)  # Remove mentions and hashtags
+        # Every contraction contains an apostrophe, so most texts skip the regex entirely
+        if "'" in text:
+            text = self._contraction_re.sub(lambda m: self._expansions[m.group(0)], text)
+        text = NON_ALPHA_RE.sub('', str(text).lower())
+        text = URL_RE.sub('', text)
+        text = MENTION_RE.sub('', text)  # Remove mentions and hashtags
         tokens = text.split()
-        tokens = [lemmatizer.lemmatize(w) for w in tokens if w not in stop_words and len(w) > 2]
+        tokens = [lemmatize(w) for w in tokens if w not in stop_words and len(w) > 2]
         return ' '.join(tokens)
 
 
@@ -95,10 +158,8 @@ class LoadNormalisedData:
         # Calculate mean coordinates for all neighbourhoods at once (vectorized)
         coords_by_neighbourhood = self.listings.groupby('neighbourhood_id')[['latitude', 'longitude']].mean()
         
-        # For each ward with NaN coordinates, fill with mean from listings
-        for ward_id in nan_wards:
-            if ward_id in coords_by_neighbourhood.index:
-                new_wards.loc[new_wards['neighbourhood_id'] == ward_id, 'latitude'] = coords_by_neighbourhood.loc[ward_id, 'latitude']
-                new_wards.loc[new_wards['neighbourhood_id'] == ward_id, 'longitude'] = coords_by_neighbourhood.loc[ward_id, 'longitude']
+        # Fill NaN coordinates with the listings mean for their ward in one aligned pass
+        for col in ['latitude', 'longitude']:
+            new_wards[col] = new_wards[col].fillna(new_wards['neighbourhood_id'].map(coords_by_neighbourhood[col]))
 
         return new_wards 
\ No newline at end of file
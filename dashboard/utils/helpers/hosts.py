@@ -2,44 +2,61 @@ from .universal import UIHelper
 
 # Hosts helper functions
 class HostsHelper(UIHelper):
+    # Host metrics for every ward, aggregated once and shared by all hosts helpers
+    _metrics_by_ward = None
+    # Cape Town wide host metrics, computed once and shared by all hosts helpers
+    _global_metrics = None
+    # Metrics compared against the Cape Town baseline
+    DELTA_KEYS = ('mean_response_rate', 'mean_acceptance_rate', 'verified_hosts_percent', 'super_hosts_percent')
+
+    # listings_info should already be the listings for the selected ward (e.g.
+    # ListingsHelper(option).get_filtered_listings()), so host ids are collected
+    # from the ward slice rather than every listing in Cape Town
     def __init__(self, option, listings_info):
         super().__init__()
         self.option = option
         self.listings_info = listings_info
+        self._filtered_hosts = None
 
     # Loads uniqe host dataframe
     def load_hosts(self):
         return self.host_data.transform_hosts()
    
-    # Hosts processing functions
+    # Hosts processing functions, filtered once per ward and reused
     def get_filtered_hosts(self):
-        hosts = self.load_hosts()
-        return self.host_processes.filter_hosts_by_ward(hosts, self.listings_info, self.option)
+        if self._filtered_hosts is None:
+            hosts = self.load_hosts()
+            host_index = self.host_data.index_hosts_by_id()
+            self._filtered_hosts = self.host_processes.filter_hosts_by_ward(hosts, self.listings_info, self.option, host_index)
+        return self._filtered_hosts
+
+    def load_metrics_by_ward(self):
+        if HostsHelper._metrics_by_ward is None:
+            hosts = self.load_hosts()
+            rated_listings = self.listings_data.transform_listings_with_ratings()
+            HostsHelper._metrics_by_ward = self.host_processes.get_metrics_by_ward_hosts(hosts, rated_listings)
+        return HostsHelper._metrics_by_ward
 
-    # Hosts metrics function
+    # Hosts metrics function, looked up from the per-ward aggregates when a ward is selected
     def get_filtered_host_metrics(self):
+        processes = self.host_processes
+        metrics = processes.lookup_ward_metrics(self.load_metrics_by_ward(), self.option)
+        if metrics is not None:
+            return metrics
         filtered_hosts = self.get_filtered_hosts()
-        return self.host_processes.get_metrics_for_ward_hosts(filtered_hosts)
+        return processes.get_metrics_for_ward_hosts(filtered_hosts)
 
     # Gets global host metrics for delta calculations
     def get_global_host_metrics(self):
-        hosts = self.load_hosts()
-        return self.host_processes.get_global_host_metrics(hosts)
+        if HostsHelper._global_metrics is None:
+            hosts = self.load_hosts()
+            HostsHelper._global_metrics = self.host_processes.get_global_host_metrics(hosts)
+        return HostsHelper._global_metrics
     
-    # Calculates deltas for currently selected ward
-    def get_host_deltas(self):
+    # Calculates deltas for currently selected ward, reusing global metrics when supplied
+    def get_host_deltas(self, global_host_metrics=None):
         filtered_hosts_metrics = self.get_filtered_host_metrics()
-        global_host_metrics = self.get_global_host_metrics()
+        if global_host_metrics is None:
+            global_host_metrics = self.get_global_host_metrics()
 
-        delta_mean_response_rate = filtered_hosts_metrics['mean_response_rate'] - global_host_metrics['mean_response_rate']
-        delta_mean_acceptance_rate = filtered_hosts_metrics['mean_acceptance_rate'] - global_host_metrics['mean_acceptance_rate']
-        delta_verified_hosts_percent = filtered_hosts_metrics['verified_hosts_percent'] - global_host_metrics['verified_hosts_percent']
-        delta_super_hosts_percent = filtered_hosts_metrics['super_hosts_percent'] - global_host_metrics['super_hosts_percent']      
-        
-        deltas = {
-            'mean_response_rate_delta': delta_mean_response_rate,
-            'mean_acceptance_rate_delta': delta_mean_acceptance_rate,
-            'verified_hosts_percent_delta': delta_verified_hosts_percent,
-            'super_hosts_percent_delta': delta_super_hosts_percent,
-        }
-        return deltas
\ No newline at end of file
+        return self.host_processes.get_metric_deltas(filtered_hosts_metrics, global_host_metrics, self.DELTA_KEYS)
\ No newline at end of file
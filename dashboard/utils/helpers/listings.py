@@ -3,9 +3,17 @@ from .universal import UIHelper
 
 # Listings helper functions
 class ListingsHelper(UIHelper):
+    # Metrics for every ward, aggregated once and shared by all listings helpers
+    _metrics_by_ward = None
+    # Cape Town wide metrics, computed once and shared by all listings helpers
+    _global_metrics = None
+    # Metrics compared against the Cape Town baseline
+    DELTA_KEYS = ('min_price', 'max_price', 'average_price', 'average_rating', 'average_occupancy', 'average_revenue')
+
     def __init__(self, option=None):
         super().__init__()
         self.option = option
+        self._filtered_listings = None
 
     def load_rated_listings(self):
         return self.listings_data.transform_listings_with_ratings()
@@ -15,15 +23,33 @@ class ListingsHelper(UIHelper):
         rated_listings = self.load_rated_listings()
         return self.listings_processes.get_data_table(rated_listings)
 
-    # Listings filtering function
+    # Listings filtering function, filtered once per ward and reused
     def get_filtered_listings(self):
-        rated_listings = self.load_rated_listings()
-        return self.listings_processes.filter_listings_by_ward(rated_listings, self.option)
+        if self._filtered_listings is None:
+            rated_listings = self.load_rated_listings()
+            ward_indices = self.listings_data.index_listings_by_ward()
+            self._filtered_listings = self.listings_processes.filter_listings_by_ward(rated_listings, self.option, ward_indices)
+        return self._filtered_listings
 
-    # Listings metrics function
+    def load_metrics_by_ward(self):
+        if ListingsHelper._metrics_by_ward is None:
+            rated_listings = self.load_rated_listings()
+            ListingsHelper._metrics_by_ward = self.listings_processes.get_metrics_by_ward_listings(rated_listings)
+        return ListingsHelper._metrics_by_ward
+
+    # Listings metrics function, looked up from the per-ward aggregates when a ward is selected
     def get_listing_metrics(self):
+        processes = self.listings_processes
+        metrics = processes.lookup_ward_metrics(self.load_metrics_by_ward(), self.option)
+        if metrics is not None:
+            return metrics
         filtered_listings = self.get_filtered_listings()
-        return self.listings_processes.get_metrics_for_ward_listings(filtered_listings)
+        return processes.get_metrics_for_ward_listings(filtered_listings)
+
+    # Listing locations as GeoJSON for the map layer
+    def get_listings_geojson(self):
+        filtered_listings = self.get_filtered_listings()
+        return self.listings_processes.make_listings_geojson(filtered_listings)
 
     # Show sunburst chart in UI
     def show_tree_chart(self):
@@ -32,27 +58,15 @@ class ListingsHelper(UIHelper):
     
     # Global metrics for listings used in delta calculations
     def get_global_listing_metrics(self):
-        rated_listings = self.load_rated_listings()
-        return self.listings_processes.get_global_listing_metrics(rated_listings)
+        if ListingsHelper._global_metrics is None:
+            rated_listings = self.load_rated_listings()
+            ListingsHelper._global_metrics = self.listings_processes.get_global_listing_metrics(rated_listings)
+        return ListingsHelper._global_metrics
     
-    # Delta calculations for listing metrics
-    def get_listing_deltas(self):
+    # Delta calculations for listing metrics, reusing global metrics when supplied
+    def get_listing_deltas(self, global_listing_metrics=None):
         filtered_listing_metrics = self.get_listing_metrics()
-        global_listing_metrics = self.get_global_listing_metrics()
-
-        min_price_delta =  filtered_listing_metrics['min_price'] - global_listing_metrics['min_price']
-        max_price_delta = filtered_listing_metrics['max_price'] - global_listing_metrics['max_price']
-        average_price_delta =  filtered_listing_metrics['average_price'] - global_listing_metrics['average_price']
-        average_rating_delta = filtered_listing_metrics['average_rating'] - global_listing_metrics['average_rating']
-        average_occupancy_delta = filtered_listing_metrics['average_occupancy'] - global_listing_metrics['average_occupancy']
-        average_revenue_delta = filtered_listing_metrics['average_revenue'] - global_listing_metrics['average_revenue']
-
-        deltas = {
-            'min_price_delta': min_price_delta,
-            'max_price_delta': max_price_delta,
-            'average_price_delta': average_price_delta,
-            'average_rating_delta': average_rating_delta,
-            'average_occupancy_delta': average_occupancy_delta,
-            'average_revenue_delta': average_revenue_delta,
-        }
-        return deltas
\ No newline at end of file
+        if global_listing_metrics is None:
+            global_listing_metrics = self.get_global_listing_metrics()
+
+        return self.listings_processes.get_metric_deltas(filtered_listing_metrics, global_listing_metrics, self.DELTA_KEYS)
\ No newline at end of file
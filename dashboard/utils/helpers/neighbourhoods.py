@@ -4,8 +4,17 @@ from  .universal import UIHelper
 
 # Neighbourhood helper class
 class NeighbourhoodsHelper(UIHelper):
+    # Metrics compared against the Cape Town baseline
+    DELTA_KEYS = ('overall_score', 'positive_reviews_percent', 'negative_reviews_percent', 'neutral_reviews_percent')
+
     def __init__(self):
-        super().__init__()  
+        super().__init__()
+        # Filtered overviews keyed by ward option
+        self._filtered_overviews = {}
+        # Sentiment metrics for every ward, aggregated once
+        self._sentiment_metrics_by_ward = None
+        # Cape Town wide sentiment metrics, computed once
+        self._global_sentiment_metrics = None
     
     def load_neighbourhoods(self):
         return self.neighbourhoods_data.transform_neighbourhoods()
@@ -16,38 +25,46 @@ class NeighbourhoodsHelper(UIHelper):
     
     def get_filtered_neighbourhood(self, option):
         neighbourhoods = self.load_neighbourhoods()
-        return self.neighbourhoods_processes.filter_ward_by_option(neighbourhoods, option)
+        name_indices = self.neighbourhoods_data.index_neighbourhoods_by_name()
+        return self.neighbourhoods_processes.filter_ward_by_option(neighbourhoods, option, name_indices)
     
     def load_neighbourhood_overviews(self):
         return self.neighbourhoods_data.transform_neighbourhood_overviews()
     
     def get_filtered_neighbourhood_overviews(self, option):
-        neighbourhood_overviews = self.load_neighbourhood_overviews()
-        return self.neighbourhoods_processes.filter_neighbourhood_reviews_by_ward(neighbourhood_overviews, option)
+        filtered_overviews = self._filtered_overviews
+        if option not in filtered_overviews:
+            neighbourhood_overviews = self.load_neighbourhood_overviews()
+            ward_indices = self.neighbourhoods_data.index_overviews_by_ward()
+            filtered_overviews[option] = self.neighbourhoods_processes.filter_neighbourhood_reviews_by_ward(neighbourhood_overviews, option, ward_indices)
+        return filtered_overviews[option]
+
+    def load_sentiment_metrics_by_ward(self):
+        if self._sentiment_metrics_by_ward is None:
+            neighbourhood_overviews = self.load_neighbourhood_overviews()
+            self._sentiment_metrics_by_ward = self.neighbourhoods_processes.get_sentiment_metrics_by_ward(neighbourhood_overviews)
+        return self._sentiment_metrics_by_ward
 
     def get_neighbourhood_sentiment_metrics(self, option):
+        processes = self.neighbourhoods_processes
+        metrics = processes.lookup_ward_metrics(self.load_sentiment_metrics_by_ward(), option)
+        if metrics is not None:
+            return metrics
         filtered_neighbourhood_overview = self.get_filtered_neighbourhood_overviews(option)
-        return self.neighbourhoods_processes.get_neighbourhood_sentiment_metrics(filtered_neighbourhood_overview)
+        return processes.get_neighbourhood_sentiment_metrics(filtered_neighbourhood_overview)
     
     def get_global_neighbourhood_sentiment_metrics(self):
-        neighbourhood_overviews = self.load_neighbourhood_overviews()
-        return self.neighbourhoods_processes.get_neighbourhood_sentiment_metrics(neighbourhood_overviews)
+        if self._global_sentiment_metrics is None:
+            neighbourhood_overviews = self.load_neighbourhood_overviews()
+            self._global_sentiment_metrics = self.neighbourhoods_processes.get_neighbourhood_sentiment_metrics(neighbourhood_overviews)
+        return self._global_sentiment_metrics
     
-    def get_neighbourhood_sentiment_deltas(self, option):
+    def get_neighbourhood_sentiment_deltas(self, option, global_sentiment_metrics=None):
         filtered_sentiment_metrics = self.get_neighbourhood_sentiment_metrics(option)
-        global_sentiment_metrics = self.get_global_neighbourhood_sentiment_metrics()
-
-        overall_score_delta = filtered_sentiment_metrics['overall_score'] - global_sentiment_metrics['overall_score']
-        positive_reviews_delta = filtered_sentiment_metrics['positive_reviews_percent'] - global_sentiment_metrics['positive_reviews_percent']
-        negative_reviews_delta = filtered_sentiment_metrics['negative_reviews_percent'] - global_sentiment_metrics['negative_reviews_percent']
-        neutral_reviews_delta = filtered_sentiment_metrics['neutral_reviews_percent'] - global_sentiment_metrics['neutral_reviews_percent']
+        if global_sentiment_metrics is None:
+            global_sentiment_metrics = self.get_global_neighbourhood_sentiment_metrics()
 
-        return {
-            'overall_score_delta': overall_score_delta,
-            'positive_reviews_percent_delta': positive_reviews_delta,
-            'negative_reviews_percent_delta': negative_reviews_delta,
-            'neutral_reviews_percent_delta': neutral_reviews_delta,
-        }
+        return self.neighbourhoods_processes.get_metric_deltas(filtered_sentiment_metrics, global_sentiment_metrics, self.DELTA_KEYS)
     
     def show_neighbourhood_wordcloud(self, option):
         filtered_overviews = self.get_filtered_neighbourhood_overviews(option)
@@ -19,13 +19,14 @@ neighbourhoods_processes = NeighbourhoodsProcesses()
 # Neighbourhoods helper functions
 
 class UIHelper:
-    def __init__(self):
-        self.host_data = host_data
-        self.host_processes = host_processes
-        self.listings_data = listings_data
-        self.listings_processes = listings_processes
-        self.neighbourhoods_data = neighbourhoods_data
-        self.neighbourhoods_processes = neighbourhoods_processes
+    # Loaders and processes are module singletons, so bind them once on the class
+    # rather than copying them into every helper instance
+    host_data = host_data
+    host_processes = host_processes
+    listings_data = listings_data
+    listings_processes = listings_processes
+    neighbourhoods_data = neighbourhoods_data
+    neighbourhoods_processes = neighbourhoods_processes
 
      
 
@@ -1,3 +1,4 @@
+import numpy as np
 from .universal import DashboardProcesses
 
 
@@ -5,13 +6,15 @@ class HostsProcesses(DashboardProcesses):
     def __init__(self):
         super().__init__()
 
-    def filter_hosts_by_ward(self, df, listings_info, option=None):
+    def filter_hosts_by_ward(self, df, listings_info, option=None, host_index=None):
             """Filter hosts dataframe to include only hosts from selected ward.
             
             Args:
                 df: pandas DataFrame containing host data
                 listings_info: pandas DataFrame containing listings information
                 option: str or None, ward selection (used to determine if filtering should occur)
+                host_index: optional pandas Index over df['host_id'], used to look up
+                    the ward's hosts directly instead of hashing every row of df
                 
             Returns:
                 pandas DataFrame: filtered or original hosts dataframe
@@ -25,7 +28,12 @@ class HostsProcesses(DashboardProcesses):
             
             # If no hosts found in the ward, return empty dataframe with same structure
             if len(ward_hosts) == 0:
-                return df[df['host_id'].isin([])]
+                return df.iloc[:0]
+
+            # Probe the prebuilt index with the ward's hosts, keeping df's row order
+            if host_index is not None:
+                positions = host_index.get_indexer(ward_hosts)
+                return df.take(np.sort(positions[positions >= 0]))
             
             # Filter hosts to only those with listings in the selected ward
             return df[df['host_id'].isin(ward_hosts)]
@@ -34,7 +42,7 @@ class HostsProcesses(DashboardProcesses):
         """Calculate key metrics for hosts in the selected ward.
         
         Args:
-            df: pandas DataFrame containing host data
+            df: pandas DataFrame containing host data, one row per host_id
             
         Returns:
             dict: metrics including total hosts, response/acceptance rates, and verification percentages
@@ -49,16 +57,20 @@ class HostsProcesses(DashboardProcesses):
             }
         
         else:
-            total_hosts = df['host_id'].nunique()
-            mean_response_rate = df['host_response_rate'].mean() if 'host_response_rate' in df.columns else 0.0
-            mean_acceptance_rate = df['host_acceptance_rate'].mean() if 'host_acceptance_rate' in df.columns else 0.0
+            # Hosts are deduplicated on load, so every row is a distinct host
+            total_hosts = len(df)
+            # Reduce the rate and flag columns in one pass each, skipping any that are missing
+            rate_means = df[df.columns.intersection(['host_response_rate', 'host_acceptance_rate'])].mean()
+            flag_sums = df[df.columns.intersection(['host_is_superhost', 'host_identity_verified'])].sum()
+            mean_response_rate = rate_means.get('host_response_rate', 0.0)
+            mean_acceptance_rate = rate_means.get('host_acceptance_rate', 0.0)
 
-            num_superhosts = df['host_is_superhost'].sum() if 'host_is_superhost' in df.columns else 0
+            num_superhosts = flag_sums.get('host_is_superhost', 0)
             #print("Number of superhosts:", num_superhosts)
             percent_superhosts = (num_superhosts / total_hosts) * 100
             #print("Percent superhosts:", percent_superhosts)
             
-            num_verified_hosts = df['host_identity_verified'].sum() if 'host_identity_verified' in df.columns else 0
+            num_verified_hosts = flag_sums.get('host_identity_verified', 0)
             #print("Number of verified hosts:", num_verified_hosts)
             percent_verified_hosts = (num_verified_hosts / total_hosts) * 100
             #print("Percent verified hosts:", percent_verified_hosts)
@@ -78,6 +90,33 @@ class HostsProcesses(DashboardProcesses):
 
             return metrics
             
+    def get_metrics_by_ward_hosts(self, df, listings_info):
+        """Calculate key host metrics for every ward in a single groupby pass.
+        
+        Args:
+            df: pandas DataFrame containing host data, one row per host_id
+            listings_info: pandas DataFrame containing listings with 'neighbourhood_id' and 'host_id'
+            
+        Returns:
+            dict: metrics dicts keyed by neighbourhood_id, matching get_metrics_for_ward_hosts
+        """
+        # Pair each ward with the hosts that have listings in it; each pair is
+        # unique, so a ward's row count is its number of distinct hosts
+        ward_hosts = listings_info[['neighbourhood_id', 'host_id']].drop_duplicates()
+        ward_hosts = ward_hosts.merge(df, on='host_id', how='inner')
+
+        ward_metrics = ward_hosts.groupby('neighbourhood_id', sort=False).agg(
+            total_hosts=('host_id', 'size'),
+            mean_response_rate=('host_response_rate', 'mean'),
+            mean_acceptance_rate=('host_acceptance_rate', 'mean'),
+            super_hosts_count=('host_is_superhost', 'sum'),
+            verified_hosts_count=('host_identity_verified', 'sum')
+        )
+        ward_metrics['super_hosts_percent'] = (ward_metrics['super_hosts_count'] / ward_metrics['total_hosts']) * 100
+        ward_metrics['verified_hosts_percent'] = (ward_metrics['verified_hosts_count'] / ward_metrics['total_hosts']) * 100
+
+        return ward_metrics.to_dict(orient='index')
+
     # Alias for global host metrics
     def get_global_host_metrics(self, df):
         """Alias for get_metrics_for_ward_hosts to calculate global host metrics.
@@ -1,18 +1,20 @@
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
 from .universal import DashboardProcesses
 
 class ListingsProcesses(DashboardProcesses):
     def __init__(self):
         super().__init__()
 
-    def filter_listings_by_ward(self, df, ward_name):
+    def filter_listings_by_ward(self, df, ward_name, ward_indices=None):
         """Filters the listings DataFrame to include only listings in the specified ward.
         
         Args:
             df: pandas DataFrame containing listings with a 'neighbourhood_id' column
             ward_name: str or None, name of the ward to filter by (e.g., 'Ward 1')
+            ward_indices: optional dict of row positions in df keyed by neighbourhood_id,
+                used for a direct take instead of scanning df
             
         Returns:
             pandas DataFrame: filtered listings in the specified ward
@@ -24,8 +26,23 @@ class ListingsProcesses(DashboardProcesses):
         if ward_id == float('inf'):
             return df
         
+        if ward_indices is not None:
+            return df.take(ward_indices.get(ward_id, []))
+        
         return df[df['neighbourhood_id'] == ward_id]
 
+    def _non_missing(self, series):
+        """Return the non-NaN values of a numeric column as a NumPy array.
+        
+        Args:
+            series: pandas Series of numeric values
+            
+        Returns:
+            numpy.ndarray: values with missing entries removed
+        """
+        values = series.to_numpy()
+        return values[~np.isnan(values)]
+
     def get_metrics_for_ward_listings(self, df):
         """Calculates key metrics for the given ward's listings.
         
@@ -50,17 +67,21 @@ class ListingsProcesses(DashboardProcesses):
             }
         
         else:
-            # Calculate metrics, using 0 as default for missing values
-            min_price = df['price_usd'].min() if not df['price_usd'].isna().all() else 0.0
-            max_price = df['price_usd'].max() if not df['price_usd'].isna().all() else 0.0
-            min_rating = df['review_scores_rating'].min() if not df['review_scores_rating'].isna().all() else 0.0
-            max_rating = df['review_scores_rating'].max() if not df['review_scores_rating'].isna().all() else 0.0   
-            average_price = df['price_usd'].mean() if not df['price_usd'].isna().all() else 0.0
-            average_rating = df['review_scores_rating'].mean() if not df['review_scores_rating'].isna().all() else 0.0
+            # Reduce the underlying arrays with NumPy, using 0 as default for missing values
+            prices = self._non_missing(df['price_usd'])
+            ratings = self._non_missing(df['review_scores_rating'])
+            occupancy = self._non_missing(df['estimated_occupancy_l365d'])
+            revenue = self._non_missing(df['estimated_revenue_l365d'])
+            min_price = float(prices.min()) if prices.size else 0.0
+            max_price = float(prices.max()) if prices.size else 0.0
+            min_rating = float(ratings.min()) if ratings.size else 0.0
+            max_rating = float(ratings.max()) if ratings.size else 0.0
+            average_price = float(prices.mean()) if prices.size else 0.0
+            average_rating = float(ratings.mean()) if ratings.size else 0.0
             total_hosts = df['host_id'].nunique()
             total_listings = len(df)
-            average_occupancy = df['estimated_occupancy_l365d'].mean() if not df['estimated_occupancy_l365d'].isna().all() else 0.0
-            average_revenue = (df['estimated_revenue_l365d'].mean() / 12) if not df['estimated_revenue_l365d'].isna().all() else 0.0
+            average_occupancy = float(occupancy.mean()) if occupancy.size else 0.0
+            average_revenue = (float(revenue.mean()) if revenue.size else 0.0) / 12
            
             metrics = {
                 'min_price': min_price,
@@ -77,6 +98,33 @@ class ListingsProcesses(DashboardProcesses):
         return metrics
     
 
+    def get_metrics_by_ward_listings(self, df):
+        """Calculates key metrics for every ward's listings in a single groupby pass.
+        
+        Args:
+            df: pandas DataFrame containing listings with a 'neighbourhood_id' column
+            
+        Returns:
+            dict: metrics dicts keyed by neighbourhood_id, matching get_metrics_for_ward_listings
+        """
+        ward_metrics = df.groupby('neighbourhood_id', sort=False).agg(
+            min_price=('price_usd', 'min'),
+            max_price=('price_usd', 'max'),
+            min_rating=('review_scores_rating', 'min'),
+            max_rating=('review_scores_rating', 'max'),
+            average_price=('price_usd', 'mean'),
+            average_occupancy=('estimated_occupancy_l365d', 'mean'),
+            average_revenue=('estimated_revenue_l365d', 'mean'),
+            average_rating=('review_scores_rating', 'mean'),
+            total_hosts=('host_id', 'nunique'),
+            total_listings=('listing_id', 'size')
+        )
+        ward_metrics['average_revenue'] = ward_metrics['average_revenue'] / 12
+        
+        # Use 0 as default for wards where a column is entirely missing
+        return ward_metrics.fillna(0.0).to_dict(orient='index')
+
+
     def get_global_listing_metrics(self, df):
         """Calculate global listing metrics across all wards.
         
@@ -92,7 +140,7 @@ class ListingsProcesses(DashboardProcesses):
         """Generate summary table of listings grouped by neighbourhood.
         
         Args:
-            df: pandas DataFrame containing listings data
+            df: pandas DataFrame containing listings with price and rating data
             
         Returns:
             pandas DataFrame: aggregated table with price, rating, and listing counts by ward
@@ -100,49 +148,73 @@ class ListingsProcesses(DashboardProcesses):
         if df.empty:
             return pd.DataFrame(columns=["Price (ZAR)", "Average Rating (Stars)", "Total Listings"])
         
-        # Filter out rows with missing price or rating data
-        filtered_df = df[
-            df['price_usd'].notna() & 
-            df['review_scores_rating'].notna()
-        ]
-        
-        if filtered_df.empty:
-            return pd.DataFrame(columns=["Price (ZAR)", "Average Rating (Stars)", "Total Listings"])
-        
-        table = filtered_df.groupby('neighbourhood_id').agg({
-            'price_usd': 'mean',
-            'review_scores_rating': 'mean',
-            'listing_id': 'count'
-        }).sort_index(
-            key=lambda x: x.astype(int), 
-            ascending=True
-        )
+        # Listings are expected to be priced and rated already (see
+        # transform_listings_with_ratings), so aggregate without a pre-filter copy
+        table = df.groupby('neighbourhood_id', sort=False).agg(
+            price_usd=('price_usd', 'mean'),
+            review_scores_rating=('review_scores_rating', 'mean'),
+            listing_id=('listing_id', 'count')
+        ).sort_index(ascending=True)
         
         table.index.name = "Ward"
         table.columns = ["Price (ZAR)", "Average Rating (Stars)", "Total Listings"]
         
         # Round numeric columns to specified decimal places
-        table["Price (ZAR)"] = table["Price (ZAR)"].round(2)
-        table["Average Rating (Stars)"] = table["Average Rating (Stars)"].apply(lambda x: f"{x:.1f}")
+        table["Price (ZAR)"] = table["Price (ZAR)"].astype(float).round(2)
+        # Ratings stay numeric so the column still sorts; the dashboard formats them when rendering
+        table["Average Rating (Stars)"] = table["Average Rating (Stars)"].astype(float).round(1)
         
         return table
 
 
+    def make_listings_geojson(self, df):
+        """Build a GeoJSON FeatureCollection of listing locations.
+        
+        Args:
+            df: pandas DataFrame containing listings with coordinates, price and rating
+            
+        Returns:
+            dict: FeatureCollection with one Point feature and popup text per listing
+        """
+        # Five decimals (~1 m) is plenty for map markers and keeps the payload small
+        latitudes = df['latitude'].to_numpy(dtype=float).round(5).tolist()
+        longitudes = df['longitude'].to_numpy(dtype=float).round(5).tolist()
+        prices = df['price_usd'].to_numpy(dtype=float)
+        ratings = df['review_scores_rating'].to_numpy(dtype=float)
+
+        # Format all popup strings in one vectorised pass
+        popups = np.char.add(
+            np.char.add('Price: ZAR ', np.char.mod('%.2f', prices)),
+            np.char.add(' per night<br>Rating: ', np.char.mod('%.1f stars', ratings))
+        ).tolist()
+
+        features = [
+            {
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': [lon, lat]},
+                'properties': {'popup': popup}
+            }
+            for lat, lon, popup in zip(latitudes, longitudes, popups)
+        ]
+
+        return {'type': 'FeatureCollection', 'features': features}
+
+
     def make_tree_chart(self, df):
         """Display sunburst chart of listings by room and property type.
         
         Args:
             df: pandas DataFrame containing listings with ratings
         """
+        # Imported lazily; the chart is cached, so most sessions never build one
+        import plotly.express as px
 
-        sunburst_data = df.groupby(['room_type', 'property_type']).agg({
-            'listing_id': 'count',
-            'estimated_revenue_l365d': 'mean'
-        }).sort_values('listing_id', ascending=False).reset_index().rename(columns={
-            'listing_id': 'count',
-            'estimated_revenue_l365d': 'mean_revenue'
-        })
-        
+        # Only group the room/property type pairs that occur, not every category combination;
+        # the treemap orders tiles by value itself, so the groups are left unsorted
+        sunburst_data = df.groupby(['room_type', 'property_type'], observed=True, sort=False).agg(
+            count=('listing_id', 'size'),
+            mean_revenue=('estimated_revenue_l365d', 'mean')
+        ).reset_index()
         
         fig = px.treemap(
             sunburst_data,
@@ -1,6 +1,11 @@
+import numpy as np
+import pandas as pd
 from wordcloud import WordCloud
 import matplotlib.pyplot as plt
-from .universal import DashboardProcesses
+from .universal import DashboardProcesses, WARD_RE
+
+# Sentiment labels in the order Series.mode() breaks ties
+SENTIMENT_LABELS = ('negative', 'neutral', 'positive')
 
 # Neighbourhoods processing functions
 class NeighbourhoodsProcesses(DashboardProcesses):
@@ -22,34 +27,47 @@ class NeighbourhoodsProcesses(DashboardProcesses):
             return []
         
         # Extract unique ward values, filtering out nulls
-        wards = df[column_name].dropna().unique()
+        wards = pd.Series(df[column_name].dropna().unique())
         
-        # Sort numerically by extracted ward number
-        sorted_wards = sorted(wards, key=self._extract_num)
-        return sorted_wards
+        # Sort numerically by ward number in one vectorised pass; unmatched names sort last
+        ward_nums = wards.str.extract(WARD_RE, expand=False).astype(float).fillna(np.inf).to_numpy()
+        order = np.argsort(ward_nums, kind='stable')
+
+        # Seed the ward number cache so later ward lookups skip the regex
+        self._ward_num_cache.update(
+            (ward, int(num) if np.isfinite(num) else float('inf'))
+            for ward, num in zip(wards.tolist(), ward_nums.tolist())
+        )
+        return wards.to_numpy()[order].tolist()
     
 
-    def filter_ward_by_option(self, df, option):
+    def filter_ward_by_option(self, df, option, name_indices=None):
         """Filter dataframe by ward name option.
         
         Args:
             df: pandas DataFrame with 'name' column
             option: str or None, ward name to filter by
+            name_indices: optional dict of row positions in df keyed by ward name,
+                used for a direct take instead of comparing every name
             
         Returns:
             pandas DataFrame: filtered or original dataframe
         """
         if not option or df.empty:
             return df
+        if name_indices is not None:
+            return df.take(name_indices.get(option, []))
         return df[df['name'] == option]   
     
 
-    def filter_neighbourhood_reviews_by_ward(self, df, option):
+    def filter_neighbourhood_reviews_by_ward(self, df, option, ward_indices=None):
         """Filter dataframe by ward name option
 
         Args:
             df: pandas DataFramwe with 'neighbourhood_id' column
             option: str or None, ward name to filter by
+            ward_indices: optional dict of row positions in df keyed by neighbourhood_id,
+                used for a direct take instead of scanning df
 
         Returns:
             pandas DataFrame: filtered or original
@@ -60,6 +78,8 @@ class NeighbourhoodsProcesses(DashboardProcesses):
         ward_id = self._extract_num(option)
         if ward_id == float('inf'):
             return df
+        if ward_indices is not None:
+            return df.take(ward_indices.get(ward_id, []))
         return df[df['neighbourhood_id'] == ward_id]
     
 
@@ -100,6 +120,45 @@ class NeighbourhoodsProcesses(DashboardProcesses):
             }
 
 
+    def get_sentiment_metrics_by_ward(self, df):
+        """Calculates sentiment metrics for every ward in one vectorised pass.
+        
+        Args:
+            df: pandas DataFrame with 'neighbourhood_id', 'compound_sentiment' and 'sentiment_label' columns
+            
+        Returns:
+            dict: metrics dicts keyed by neighbourhood_id, matching get_neighbourhood_sentiment_metrics
+        """
+        if df.empty:
+            return {}
+        
+        # Encode wards as integer codes so counts and sums reduce with np.bincount
+        ward_codes, ward_ids = pd.factorize(df['neighbourhood_id'])
+        n_wards = len(ward_ids)
+        totals = np.bincount(ward_codes, minlength=n_wards)
+        score_sums = np.bincount(ward_codes, weights=df['compound_sentiment'].to_numpy(dtype=float), minlength=n_wards)
+        
+        labels = df['sentiment_label'].to_numpy()
+        label_counts = np.stack([
+            np.bincount(ward_codes[labels == label], minlength=n_wards) for label in SENTIMENT_LABELS
+        ])
+        proportions = label_counts / totals
+        overall_scores = score_sums / totals
+        # argmax returns the first maximum, matching the alphabetical tie-break of Series.mode()
+        mode_labels = np.array(SENTIMENT_LABELS)[label_counts.argmax(axis=0)]
+        
+        return {
+            ward_id: {
+                'overall_score': overall_scores[i],
+                'positive_reviews_percent': proportions[2, i],
+                'negative_reviews_percent': proportions[0, i],
+                'neutral_reviews_percent': proportions[1, i],
+                'mode_sentiment': str(mode_labels[i])
+            }
+            for i, ward_id in enumerate(ward_ids)
+        }
+
+
     def get_global_sentiment_metrics(self, df):
         """Calculate global sentiment metrics across all wards.
         
@@ -121,7 +180,8 @@ class NeighbourhoodsProcesses(DashboardProcesses):
         """
         if df.empty or 'cleaned_overview' not in df.columns:
             return None
-        text = ' '.join(df['cleaned_overview'].dropna())
+        # str.cat skips missing overviews, like joining the non-null values
+        text = df['cleaned_overview'].str.cat(sep=' ')
         if not text.strip():
             return None
         wc = WordCloud(
@@ -1,9 +1,15 @@
 import re
 import pandas as pd
 
+# Ward names look like 'Ward 12'; compiled once for scalar and vectorised lookups
+WARD_RE = re.compile(r'Ward (\d+)')
+
 
 class DashboardProcesses:
     """Utility class for dashboard data processing and filtering operations."""
+    # Ward numbers keyed by ward name, shared by every processes instance
+    _ward_num_cache = {}
+
     def __init__(self):
         pass
 
@@ -16,7 +22,40 @@ class DashboardProcesses:
         Returns:
             int: ward number or float('inf') if no match found
         """
-        match = re.search(r'Ward (\d+)', ward)
-        return int(match.group(1)) if match else float('inf') 
+        num = self._ward_num_cache.get(ward)
+        if num is None:
+            # Plain 'Ward {num}' names need no regex
+            if ward.startswith('Ward ') and ward[5:].isdecimal():
+                num = int(ward[5:])
+            else:
+                match = WARD_RE.search(ward)
+                num = int(match.group(1)) if match else float('inf')
+            self._ward_num_cache[ward] = num
+        return num
 
-    
+    def lookup_ward_metrics(self, metrics_by_ward, ward_name):
+        """Look up precomputed metrics for the selected ward.
+        
+        Args:
+            metrics_by_ward: dict of metrics dicts keyed by neighbourhood_id
+            ward_name: str or None, ward name (e.g., 'Ward 1')
+            
+        Returns:
+            dict or None: metrics for the ward, or None if no known ward is selected
+        """
+        if not ward_name:
+            return None
+        return metrics_by_ward.get(self._extract_num(ward_name))
+
+    def get_metric_deltas(self, metrics, baseline_metrics, keys):
+        """Subtract baseline metrics from a ward's metrics.
+        
+        Args:
+            metrics: dict of metrics for the selected ward
+            baseline_metrics: dict of Cape Town wide metrics
+            keys: iterable of metric names to compare
+            
+        Returns:
+            dict: differences keyed as '{key}_delta'
+        """
+        return {f'{key}_delta': metrics[key] - baseline_metrics[key] for key in keys}
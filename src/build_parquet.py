@@ -0,0 +1,41 @@
+"""Convert the raw CSV exports to Parquet for faster dashboard start-up.
+
+Run once from the project root after refreshing ``data/raw``::
+
+    python -m src.build_parquet
+
+The dashboard reads ``data/parquet/<name>.parquet`` when present and falls
+back to the raw CSVs otherwise.
+"""
+import pandas as pd
+from pathlib import Path
+from typing import Dict
+
+
+project_root = Path(__file__).resolve().parents[1]
+raw_dir = project_root / 'data' / 'raw'
+parquet_dir = project_root / 'data' / 'parquet'
+
+RAW_FILES: Dict[str, str] = {
+    'reviews': 'reviews.csv.gz',
+    'listings': 'listings.csv.gz',
+    'wards': 'wards.csv',
+}
+
+
+def build_parquet(raw_dir: Path = raw_dir, parquet_dir: Path = parquet_dir) -> None:
+    """Write a zstd-compressed Parquet copy of each raw CSV the dashboard reads.
+
+    Args:
+        raw_dir: Directory containing the raw CSV exports.
+        parquet_dir: Directory the Parquet files are written to.
+    """
+    parquet_dir.mkdir(parents=True, exist_ok=True)
+    for name, filename in RAW_FILES.items():
+        df = pd.read_csv(raw_dir / filename)
+        df.to_parquet(parquet_dir / f'{name}.parquet', engine='pyarrow', compression='zstd', index=False)
+        print(f'{filename} -> {name}.parquet ({len(df)} rows)')
+
+
+if __name__ == '__main__':
+    build_parquet()
@@ -36,13 +36,12 @@ class NormaliseReviews:
             A cleaned DataFrame with rows containing all NA values and exact
             duplicates removed.
         """
-        df = self.df.copy()
-        # Remove rows with all missing values and exact duplicates.
-        df = df.dropna(axis=0, how='all').drop_duplicates()
-        # Convert id columns to integers
-        for col in df.columns:
-            if "id" in col:
-                df[col] = df[col].astype(int)
+        # Remove rows with all missing values and exact duplicates. Both return
+        # new frames, so the raw reviews are left untouched without a full copy.
+        df = self.df.dropna(axis=0, how='all').drop_duplicates()
+        # Convert id columns to integers in a single astype
+        id_cols = [col for col in df.columns if "id" in col]
+        df = df.astype({col: 'int64' for col in id_cols})
         return df
 
 
@@ -105,6 +104,12 @@ class NormaliseListings:
         self.df = listings
         # Run general preprocessing once and reuse the result for all normalisers.
         self.preprocessed = self._general_listings_preprocessing()
+        # Group the preprocessed columns by keyword once so each normaliser can
+        # pick its columns without rescanning the column index.
+        self._col_groups = {
+            key: [col for col in self.preprocessed.columns if key in col]
+            for key in ('host', 'neighbourhood', 'availability', 'nights', 'review', 'scrape')
+        }
         # Construct a list of columns to drop when creating the flattened listings
         # relation. This is derived from the preprocessed DataFrame.
         self.droplist = self._construct_droplist()
@@ -116,15 +121,12 @@ class NormaliseListings:
         The method collects all columns containing certain keywords and
         filters out identifier columns so that joined tables can keep ids.
         """
-        df = self.preprocessed
-
         keys = ['neighbourhood', 'host', 'availability', 'nights', 'review', 'scrape']
 
         droplist: List[str] = []
         for key in keys:
             # Aggregate any column that contains the keyword
-            subset = [col for col in df.columns if key in col]
-            droplist += subset
+            droplist += self._col_groups[key]
 
         # Remove columns that include 'id' — those are the keys we'll keep.
         droplist = [col for col in droplist if 'id' not in col]
@@ -170,39 +172,39 @@ class NormaliseListings:
         - Extract a simplified neighbourhood id
         - Convert common boolean-like string flags to real booleans
         """
-        df = self.df.copy()
+        df = self.df
         night_data_cols = [col for col in df.columns if 'nights' in col]
-        # Ensure rows missing essential night data are removed.
-        df.dropna(subset=night_data_cols, inplace=True)
+        # Ensure rows missing essential night data are removed. dropna returns a
+        # new frame, so the raw listings are left untouched without a full copy.
+        df = df.dropna(subset=night_data_cols)
         # Drop columns that are mostly empty (keeping columns with at least
         # 10% non-null values).
-        df.dropna(thresh=int(0.1 * df.shape[0]), axis=1, inplace=True)
-        df.rename(
+        df = df.dropna(thresh=int(0.1 * df.shape[0]), axis=1).rename(
             columns={
                 'id': 'listing_id',
                 'source': 'scrape_source',
                 'neighborhood_overview': 'neighbourhood_overview',
-            },
-            inplace=True,
+            }
         )
-        # Create a neighbourhood id by stripping known prefixes; this is a
-        # lightweight transformation suitable for grouping.
-        df['neighbourhood_id'] = df['neighbourhood_cleansed'].str.replace('Ward', '').str.strip()
         
         # Convert common boolean-like flags encoded as 't'/'f' to real bools.
         bool_cols = [
             'has_availability', 'instant_bookable', 'host_is_superhost',
             'host_has_profile_pic', 'host_identity_verified'
         ]
+        present_bool_cols = [col for col in bool_cols if col in df.columns]
         
-        for col in bool_cols:
-            if col in df.columns:
-                df[col] = df[col] == 't'
+        # Add a neighbourhood id by stripping known prefixes (a lightweight
+        # transformation suitable for grouping) and the converted flags in one
+        # assign, so no step writes into the dropna result in place.
+        df = df.assign(
+            neighbourhood_id=df['neighbourhood_cleansed'].str.replace('Ward', '').str.strip(),
+            **{col: df[col] == 't' for col in present_bool_cols}
+        )
         
-        # Convert id columns to integers
-        for col in df.columns:
-            if "id" in col and col not in bool_cols:
-                df[col] = df[col].astype(int)
+        # Convert id columns to integers in a single astype
+        id_cols = [col for col in df.columns if "id" in col and col not in bool_cols]
+        df = df.astype({col: 'int64' for col in id_cols})
         
         return df
 
@@ -216,17 +218,20 @@ class NormaliseListings:
         """
         df = self.preprocessed
         # Collect host-related columns and deduplicate
-        host_cols = [col for col in df.columns if 'host' in col]
+        host_cols = self._col_groups['host']
         hosts = df[host_cols].drop_duplicates()
 
         # Remove url columns from the hosts relation (they will be handled
         # separately if required).
         hosts = self._extract_url_cols(hosts, 'host_id', drop=True)
         
-        # Convert rate columns to float
-        for col in hosts.columns:
-            if 'rate' in col:
-                hosts[col] = hosts[col].str.replace('%', '').astype('Float64')
+        # Convert rate columns to float, stripping '%' on Arrow-backed strings
+        rate_cols = [col for col in hosts.columns if 'rate' in col]
+        rates = hosts[rate_cols].astype('string[pyarrow]')
+        hosts = hosts.assign(**{
+            col: rates[col].str.replace('%', '', regex=False).astype('Float64')
+            for col in rate_cols
+        })
         
         # Convert object columns to string (except id and boolean columns)
         bool_cols = ['host_is_superhost', 'host_has_profile_pic', 'host_identity_verified']
@@ -237,9 +242,10 @@ class NormaliseListings:
         # Boolean columns are already converted in preprocessing, but handle if they're not
         for col in bool_cols:
             if col in hosts.columns and hosts[col].dtype != 'bool':
-                # Map various representations to boolean values
-                hosts[col] = hosts[col].map({True: True, False: False, 't': True, 'f': False, 
-                                            'True': True, 'False': False, 1: True, 0: False}).astype('boolean')
+                # Match the various true/false representations; anything else is missing
+                truthy = hosts[col].isin([True, 't', 'True', 1])
+                known = truthy | hosts[col].isin([False, 'f', 'False', 0])
+                hosts[col] = truthy.astype('boolean').where(known)
 
         return hosts
 
@@ -272,7 +278,7 @@ class NormaliseListings:
         returns them together with the listing identifier.
         """
         df = self.preprocessed
-        availability_cols = [col for col in df.columns if 'availability' in col]
+        availability_cols = self._col_groups['availability']
         availability = df[['listing_id'] + availability_cols]
         return availability
 
@@ -284,7 +290,7 @@ class NormaliseListings:
         and returns them for analysis or loading into a dedicated table.
         """
         df = self.preprocessed
-        nights_cols = [col for col in df.columns if 'nights' in col]
+        nights_cols = self._col_groups['nights']
         nights_data = df[['listing_id'] + nights_cols]
         return nights_data
 
@@ -296,7 +302,7 @@ class NormaliseListings:
         and returns them with the listing id.
         """
         df = self.preprocessed
-        reviews_cols = [col for col in df.columns if 'review' in col]
+        reviews_cols = self._col_groups['review']
         reviews = df[['listing_id'] + reviews_cols]
         return reviews
 
@@ -308,7 +314,7 @@ class NormaliseListings:
         the listing was scraped and deduplicates them.
         """
         df = self.preprocessed
-        scrape_cols = [col for col in df.columns if 'scrape' in col]
+        scrape_cols = self._col_groups['scrape']
         scrapes = df[scrape_cols].drop_duplicates()
         return scrapes
 
@@ -324,11 +330,22 @@ class NormaliseListings:
         listings_df = df.drop(columns=self.droplist)
         listings_df = self._extract_url_cols(listings_df, 'listing_id', drop=True)
         listings_df.rename(columns={'price': 'price_usd'}, inplace=True)
-        listings_df['price_usd'] = listings_df['price_usd'].str.replace('$', '').str.replace(',', '').astype('Float64')
+        # Run the string clean-up on Arrow-backed strings with literal (non-regex) replaces
+        text_cols = ['price_usd', 'room_type', 'property_type']
+        listings_df = listings_df.astype({col: 'string[pyarrow]' for col in text_cols})
+        listings_df['price_usd'] = (
+            listings_df['price_usd']
+            .str.replace('$', '', regex=False)
+            .str.replace(',', '', regex=False)
+            .astype('Float64')
+        )
         listings_df['listing_id'] = listings_df['listing_id'].astype(int)
-        listings_df['room_type'] = listings_df['room_type'].str.replace('home/apt', 'residence')
-        listings_df['property_type'] = listings_df['property_type'].str.replace('Entire', '')
-        listings_df['property_type'] = listings_df['property_type'].str.replace('Private', '')
+        listings_df['room_type'] = listings_df['room_type'].str.replace('home/apt', 'residence', regex=False)
+        listings_df['property_type'] = (
+            listings_df['property_type']
+            .str.replace('Entire', '', regex=False)
+            .str.replace('Private', '', regex=False)
+        )
         listings_df['property_type'] = listings_df['property_type'].str.lower().str.strip().astype('category')
         listings_df['room_type'] = listings_df['room_type'].str.lower().str.strip().astype('category')
         return listings_df
\ No newline at end of file